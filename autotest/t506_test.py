@@ -0,0 +1,95 @@
+import os
+import shutil
+import numpy as np
+
+from flopy.mf6.mfsimulation import MFSimulation
+from flopy.mf6.mfmodel import MFModel
+from flopy.mf6.modflow import mftdis, mfgwfdis, mfgwfsto
+from flopy.mf6.data.mfstructure import MFDataException
+
+out_dir = os.path.join('temp', 't506')
+if os.path.exists(out_dir):
+    shutil.rmtree(out_dir)
+os.makedirs(out_dir)
+
+
+def build_model(name):
+    sim_ws = os.path.join(out_dir, name)
+    sim = MFSimulation(sim_name=name, version='mf6', exe_name='mf6',
+                       sim_ws=sim_ws)
+    tdis_rc = [(1.0, 1, 1.0), (1.0, 1, 1.0)]
+    mftdis.ModflowTdis(sim, time_units='DAYS', nper=2, tdisrecarray=tdis_rc)
+    model = MFModel(sim, model_type='gwf6', model_name=name,
+                    model_nam_file='{}.nam'.format(name))
+    dis = mfgwfdis.ModflowGwfdis(model, nlay=1, nrow=1, ncol=1)
+    return sim, model, dis
+
+
+def test_scalar_convert_error():
+    sim, model, dis = build_model('convert')
+
+    # numeric data that can not be converted raises the same exception as text
+    try:
+        dis.nlay.set_data(np.nan)
+        assert False, 'NaN stored in integer scalar'
+    except MFDataException:
+        pass
+    try:
+        dis.nlay.set_data('abc')
+        assert False, 'text stored in integer scalar'
+    except MFDataException:
+        pass
+
+
+def test_scalar_set_nested_data():
+    sim, model, dis = build_model('nested')
+
+    # zero-dimensional arrays and nested lists store the scalar value
+    dis.nlay.set_data(np.array(5))
+    assert dis.nlay.get_data() == 5
+    dis.nlay.set_data([[3]])
+    assert dis.nlay.get_data() == 3
+
+
+def test_transient_scalar_file_entry():
+    sim, model, dis = build_model('transient')
+    sto = mfgwfsto.ModflowGwfsto(model, transient={0: True, 1: True})
+
+    # entries for all stress periods are separated by a blank line
+    entry_sp1 = sto.transient.get_file_entry(0)
+    entry_sp2 = sto.transient.get_file_entry(1)
+    assert entry_sp1.strip() == 'TRANSIENT'
+    assert sto.transient.get_file_entry() == '\n\n'.join([entry_sp1,
+                                                           entry_sp2])
+
+    # stress periods without data produce no entry
+    sto.steady_state.get_data(0)
+    sto.steady_state.get_data(1)
+    assert sto.steady_state.get_file_entry() == ''
+
+
+def test_transient_scalar_load_comments():
+    sim, model, dis = build_model('comments')
+
+    # comment line before the transient keyword in a period block
+    fname = 'comments.sto'
+    with open(os.path.join(out_dir, 'comments', fname), 'w') as f:
+        f.write('BEGIN period 1\n')
+        f.write('  # first period comment\n')
+        f.write('  TRANSIENT\n')
+        f.write('END period\n')
+    sto = mfgwfsto.ModflowGwfsto(model, add_to_package_list=False,
+                                 fname=fname)
+    sto.load()
+
+    assert sto.transient.get_data(0) == True
+    comments = sto.transient._data_storage[0].pre_data_comments
+    assert comments is not None
+    assert 'first period comment' in comments.text
+
+
+if __name__ == '__main__':
+    test_scalar_convert_error()
+    test_scalar_set_nested_data()
+    test_transient_scalar_file_entry()
+    test_transient_scalar_load_comments()
@@ -9,6 +9,8 @@ from ..data.mfstructure import MFDataException, MFFileParseException, MFInvalidT
 from ..data.mfdatautil import DatumUtil, FileIter, MultiListIter, ArrayUtil, ConstIter, ArrayIndexIter
 from ..coordinates.modeldimensions import DataDimensions
 
+_NUMERIC_TYPES = (int, float, np.number)
+
 
 class MFComment(object):
     """
@@ -1361,6 +1363,9 @@ class DataStorage(object):
     def convert_data(self, data, type, data_item=None):
         if type == 'float' or type == 'double':
             try:
+                if isinstance(data, _NUMERIC_TYPES):
+                    # already numeric, skip text clean up
+                    return float(data)
                 if isinstance(data, str):
                     # fix any scientific formatting that python can't handle
                     data = data.replace('d', 'e')
@@ -1374,6 +1379,9 @@ class DataStorage(object):
                 raise MFDataException(except_str)
         elif type == 'int' or type == 'integer':
             try:
+                if isinstance(data, _NUMERIC_TYPES):
+                    # already numeric, skip text clean up
+                    return int(data)
                 return int(ArrayUtil.clean_numeric(data))
             except ValueError:
                 except_str = 'Variable "{}" with value "{}" can not be converted to ' \
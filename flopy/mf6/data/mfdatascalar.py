@@ -1,8 +1,18 @@
+import sys
 import numpy as np
 from ..data import mfstructure, mfdatautil, mfdata
 from collections import OrderedDict
 from ..mfbase import ExtFileAction
 
+_INT_TYPES = frozenset(('int', 'integer'))
+_KEYWORD_TYPES = frozenset((mfstructure.DataType.scalar_keyword,
+                            mfstructure.DataType.scalar_keyword_transient))
+# built-in dict preserves insertion order starting with python 3.7
+if sys.version_info >= (3, 7):
+    _TransientStorage = dict
+else:
+    _TransientStorage = OrderedDict
+
 
 class MFScalar(mfdata.MFData):
     """
@@ -54,80 +64,110 @@ class MFScalar(mfdata.MFData):
     def __init__(self, sim_data, structure, data=None, enable=True, path=None, dimensions=None):
         super(MFScalar, self).__init__(sim_data, structure, enable, path, dimensions)
         self._data_type = self.structure.data_item_structures[0].type
+        self._name_upper = self.structure.name.upper()
+        # record items as (upper case keyword, ucase) tuples, keyword is None for items that hold data
+        self._record_items = []
+        # structure type does not change, pick the file entry builder once
+        if self.structure.type == 'keyword':
+            self._file_entry_builder = self._get_keyword_file_entry
+        elif self.structure.type == 'record':
+            self._file_entry_builder = self._get_record_file_entry
+            for data_item in self.structure.data_item_structures:
+                if data_item.type.lower() == 'keyword' and data_item.optional == False:
+                    self._record_items.append((data_item.name.upper(), data_item.ucase))
+                else:
+                    self._record_items.append((None, data_item.ucase))
+        else:
+            self._file_entry_builder = self._get_value_file_entry
         self._data_storage = self._new_storage()
+        # cache the active storage object for direct attribute access
+        self._sto = self._get_storage_obj()
         if data is not None:
             self.set_data(data)
 
+    def new_simulation(self, sim_data):
+        super(MFScalar, self).new_simulation(sim_data)
+        self._sto = None
+
     def has_data(self):
-        return self._get_storage_obj().has_data()
+        return self._sto.has_data()
 
     def get_data(self, apply_mult=False):
-        return self._get_storage_obj().get_data(apply_mult=apply_mult)
+        return self._sto.get_data(apply_mult=apply_mult)
 
     def set_data(self, data):
-        while isinstance(data, list) or isinstance(data, np.ndarray) or isinstance(data, tuple):
+        while isinstance(data, (list, tuple, np.ndarray)):
+            if isinstance(data, np.ndarray) and data.ndim == 0:
+                # zero-dimensional array, extract the scalar value directly
+                data = data.item()
+                break
             data = data[0]
-            if (isinstance(data, list) or isinstance(data, tuple)) and len(data) > 1:
+            if isinstance(data, (list, tuple)) and len(data) > 1:
                 self._add_data_line_comment(data[1:], 0)
-        self._get_storage_obj().set_data(self._get_storage_obj().convert_data(data, self._data_type,
-                                                                              self.structure.data_item_structures[0]),
-                                         key=self._current_key)
+        self._sto.set_data(self._sto.convert_data(data, self._data_type, self.structure.data_item_structures[0]),
+                           key=self._current_key)
 
     def add_one(self):
-        if self.structure.get_datum_type() == 'int' or self.structure.get_datum_type() == 'integer':
-            if self._get_storage_obj().get_data() is None:
-                self._get_storage_obj().set_data(1)
+        sto = self._sto
+        datum_type = self.structure.get_datum_type()
+        if datum_type in _INT_TYPES:
+            current_data = sto.get_data()
+            if current_data is None:
+                sto.set_data(1)
             else:
-                self._get_storage_obj().set_data(self._get_storage_obj().get_data()+1)
+                sto.set_data(current_data + 1)
         else:
             except_str = '{} of type {} does not support add one operation.'.format(self._data_name,
-                                                                                    self.structure.get_datum_type())
+                                                                                    datum_type)
             print(except_str)
             raise mfstructure.MFFileParseException(except_str)
 
     def get_file_entry(self, values_only=False, one_based=False, ext_file_action=ExtFileAction.copy_relative_paths):
-        if self._get_storage_obj() is None or self._get_storage_obj().get_data() is None:
+        sto = self._sto
+        if sto is None:
             return ''
-        if self.structure.type == 'keyword':
-            # keyword appears alone
-            return '{}{}\n'.format(self._simulation_data.indent_string,
-                                   self.structure.name.upper())
-        elif self.structure.type == 'record':
-            text_line = []
-            for data_item in self.structure.data_item_structures:
-                force_upper_case = data_item.ucase
-                if data_item.type.lower() == 'keyword' and data_item.optional == False:
-                    text_line.append(data_item.name.upper())
-                else:
-                    data = self._get_storage_obj().get_data()
-                    if len(data) > 0:
-                        text_line.append(self._get_storage_obj().to_string(self._get_storage_obj().get_data(),
-                                                                           self._data_type,
-                                                                           force_upper_case = force_upper_case))
-            return '{}{}\n'.format(self._simulation_data.indent_string,
-                                   self._simulation_data.indent_string.join(text_line))
-        else:
-            force_upper_case = self.structure.data_item_structures[0].ucase
-            if one_based:
-                assert(self.structure.type == 'integer' or self.structure.type == 'int')
-                data = self._get_storage_obj().get_data() + 1
-            else:
-                data = self._get_storage_obj().get_data()
-            # data
-            if values_only:
-                return '{}{}'.format(self._simulation_data.indent_string,
-                                     self._get_storage_obj().to_string(data, self._data_type,
-                                                                       force_upper_case = force_upper_case))
+        data = sto.get_data()
+        if data is None:
+            return ''
+        return self._file_entry_builder(sto, data, values_only, one_based)
+
+    def _get_keyword_file_entry(self, sto, data, values_only, one_based):
+        # keyword appears alone
+        return self._simulation_data.indent_string + self._name_upper + '\n'
+
+    def _get_record_file_entry(self, sto, data, values_only, one_based):
+        indent = self._simulation_data.indent_string
+        to_string = sto.to_string
+        data_type = self._data_type
+        has_values = None
+        text_line = []
+        for keyword, ucase in self._record_items:
+            if keyword is not None:
+                text_line.append(keyword)
             else:
-                # keyword + data
-                return '{}{}{}{}\n'.format(self._simulation_data.indent_string,
-                                           self.structure.name.upper(),
-                                           self._simulation_data.indent_string,
-                                           self._get_storage_obj().to_string(data, self._data_type,
-                                                                             force_upper_case = force_upper_case))
+                if has_values is None:
+                    # data does not change between items, only check it once
+                    has_values = len(data) > 0
+                if has_values:
+                    text_line.append(to_string(data, data_type, force_upper_case = ucase))
+        return indent + indent.join(text_line) + '\n'
+
+    def _get_value_file_entry(self, sto, data, values_only, one_based):
+        indent = self._simulation_data.indent_string
+        force_upper_case = self.structure.data_item_structures[0].ucase
+        if one_based:
+            assert(self.structure.type == 'integer' or self.structure.type == 'int')
+            data = data + 1
+        # data
+        if values_only:
+            return indent + sto.to_string(data, self._data_type, force_upper_case = force_upper_case)
+        else:
+            # keyword + data
+            return ''.join((indent, self._name_upper, indent,
+                            sto.to_string(data, self._data_type, force_upper_case = force_upper_case), '\n'))
 
     def load(self, first_line, file_handle, block_header, pre_data_comments=None):
-        super(MFScalar, self).load(first_line, file_handle, block_header, pre_data_comments=None)
+        super(MFScalar, self).load(first_line, file_handle, block_header, pre_data_comments)
 
         # read in any pre data comments
         current_line = self._read_pre_data_comments(first_line, file_handle, pre_data_comments)
@@ -136,36 +176,32 @@ class MFScalar(mfdata.MFData):
         # verify keyword
         index_num, aux_var_index = self._load_keyword(arr_line, 0)
 
+        struct = self.structure
+        items = struct.data_item_structures
+        first_item = items[0]
+        sto = self._sto
+        dtype = struct.get_datatype()
+
         # store data
-        if self.structure.type == 'record':
-            index = 0
-
-            for data_item_type in self.structure.get_data_item_types():
-                if len(arr_line) <= index + 1 or data_item_type != 'keyword' or (index > 0 and
-                  self.structure.data_item_structures[index].optional == True):
-                    break
-                index += 1
-
-            self._get_storage_obj().set_data(self._get_storage_obj().convert_data(arr_line[index],
-                                             self.structure.data_item_structures[index].type,
-                                             self.structure.data_item_structures[0]), key=self._current_key)
-        elif self.structure.get_datatype() == mfstructure.DataType.scalar_keyword or \
-          self.structure.get_datatype() == mfstructure.DataType.scalar_keyword_transient:
+        if struct.type == 'record':
+            # first data item after the record's keywords, limited to the last
+            # item on the line
+            index = min(struct.record_first_data_index, max(len(arr_line) - 1, 0))
+            sto.set_data(sto.convert_data(arr_line[index], items[index].type, first_item), key=self._current_key)
+        elif dtype in _KEYWORD_TYPES:
             # store as true
-            self._get_storage_obj().set_data(True, key=self._current_key)
+            sto.set_data(True, key=self._current_key)
         else:
             if len(arr_line) < 1 + index_num:
                 except_str = 'Error reading variable "{}".  Expected data after label "{}" not found ' \
                              'at line "{}".'.format(self._data_name,
-                                                    self.structure.data_item_structures[0].name.lower(),
+                                                    first_item.name.lower(),
                                                     current_line)
                 print(except_str)
                 raise mfstructure.MFFileParseException(except_str)
 
             # read next word as data
-            self._get_storage_obj().set_data(self._get_storage_obj().convert_data(arr_line[index_num], self._data_type,
-                                                                                  self.structure.data_item_structures[0]),
-                                             key=self._current_key)
+            sto.set_data(sto.convert_data(arr_line[index_num], self._data_type, first_item), key=self._current_key)
             index_num += 1
 
         if len(arr_line) > index_num:
@@ -247,29 +283,32 @@ class MFScalarTransient(MFScalar, mfdata.MFTransient):
         super(MFScalarTransient, self).add_transient_key(key)
         self._data_storage[key] = super(MFScalarTransient, self)._new_storage()
 
+    def get_data_prep(self, transient_key=0):
+        super(MFScalarTransient, self).get_data_prep(transient_key)
+        self._sto = self._get_storage_obj()
+
     def add_one(self, key=0):
         self._update_record_prep(key)
         super(MFScalarTransient, self).add_one()
 
     def has_data(self, key=None):
         if key is None:
-            data_found = False
-            for sto_key in self._data_storage.keys():
+            # stop at the first transient key that has data
+            for sto_key in self._data_storage:
                 self.get_data_prep(sto_key)
-                data_found = data_found or super(MFScalarTransient, self).has_data()
-                if data_found:
-                    break
+                if super(MFScalarTransient, self).has_data():
+                    return True
+            return False
         else:
             self.get_data_prep(key)
-            data_found = super(MFScalarTransient, self).has_data()
-        return data_found
+            return super(MFScalarTransient, self).has_data()
 
     def get_data(self, key=0):
         self.get_data_prep(key)
         return super(MFScalarTransient, self).get_data()
 
     def set_data(self, data, key=None):
-        if isinstance(data, dict) or isinstance(data, OrderedDict):
+        if isinstance(data, dict):
             # each item in the dictionary is a list for one stress period
             # the dictionary key is the stress period the list is for
             for key, list_item in data.items():
@@ -282,26 +321,37 @@ class MFScalarTransient(MFScalar, mfdata.MFTransient):
     def get_file_entry(self, key=None, ext_file_action=ExtFileAction.copy_relative_paths):
         if key is None:
             file_entry = []
-            for sto_key in self._data_storage.keys():
-                if self.has_data(sto_key):
-                    self._get_file_entry_prep(sto_key)
-                    file_entry.append(super(MFScalarTransient, self).get_file_entry(ext_file_action=ext_file_action))
-            if file_entry > 1:
-                return '\n\n'.join(file_entry)
-            elif file_entry == 1:
-                return file_entry[0]
-            else:
-                return ''
+            for sto_key in self._data_storage:
+                self._get_file_entry_prep(sto_key)
+                if super(MFScalarTransient, self).has_data():
+                    file_entry.append(super(MFScalarTransient, self).get_file_entry())
+            return '\n\n'.join(file_entry)
         else:
             self._get_file_entry_prep(key)
-            return super(MFScalarTransient, self).get_file_entry(ext_file_action=ext_file_action)
+            return super(MFScalarTransient, self).get_file_entry()
 
     def load(self, first_line, file_handle, block_header, pre_data_comments=None):
         self._load_prep(first_line, file_handle, block_header, pre_data_comments)
-        return super(MFScalarTransient, self).load(first_line, file_handle, pre_data_comments)
+        return super(MFScalarTransient, self).load(first_line, file_handle, block_header, pre_data_comments)
+
+    def _set_data_prep(self, data, transient_key=0):
+        super(MFScalarTransient, self)._set_data_prep(data, transient_key)
+        self._sto = self._get_storage_obj()
+
+    def _get_file_entry_prep(self, transient_key=0):
+        super(MFScalarTransient, self)._get_file_entry_prep(transient_key)
+        self._sto = self._get_storage_obj()
+
+    def _load_prep(self, first_line, file_handle, block_header, pre_data_comments=None):
+        super(MFScalarTransient, self)._load_prep(first_line, file_handle, block_header, pre_data_comments)
+        self._sto = self._get_storage_obj()
+
+    def _update_record_prep(self, transient_key=0):
+        super(MFScalarTransient, self)._update_record_prep(transient_key)
+        self._sto = self._get_storage_obj()
 
     def _new_storage(self):
-        return OrderedDict()
+        return _TransientStorage()
 
     def _get_storage_obj(self):
         if self._current_key is None or self._current_key not in self._data_storage:
@@ -297,6 +297,8 @@ class ArrayUtil(object):
     save_array(filename : string, multi_array : list)
         saves 'multi_array' to the file 'filename'
     """
+    _numeric_chars = frozenset('0123456789.-')
+
     def __init__(self, path=None, max_error=0.01):
         self.max_error = max_error
         if path:
@@ -471,7 +473,7 @@ class ArrayUtil(object):
     @staticmethod
     def clean_numeric(text):
         if isinstance(text, str):
-            numeric_chars = {'0': 0, '1': 0, '2': 0, '3': 0, '4': 0, '5': 0, '6': 0, '7': 0, '8': 0, '9': 0, '.': 0, '-': 0}
+            numeric_chars = ArrayUtil._numeric_chars
             # remove all non-numeric text from leading and trailing positions of text
             if text:
                 while text and (text[0] not in numeric_chars or text[-1] not in numeric_chars):
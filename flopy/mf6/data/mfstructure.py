@@ -752,6 +752,8 @@ class MFDataStructure(object):
         dictionary of expected data item names for quick lookup
     shape : tuple
         shape of first data item
+    record_first_data_index : int
+        index of the first data item in a record that is not a required keyword, computed on first access
 
     Methods
     -------
@@ -812,6 +814,7 @@ class MFDataStructure(object):
         self.model_data = model_data
         self.num_optional = 0
         self.parent_block = None
+        self._record_first_data_index = None
 
         # self.data_item_structures_dict = OrderedDict()
         self.data_item_structures = []
@@ -1089,6 +1092,19 @@ class MFDataStructure(object):
                 return index
         return None
 
+    @property
+    def record_first_data_index(self):
+        if self._record_first_data_index is None:
+            data_item_types = self.get_data_item_types()
+            index = 0
+            for data_item_type in data_item_types:
+                if data_item_type != 'keyword' or (index > 0 and
+                  self.data_item_structures[index].optional):
+                    break
+                index += 1
+            self._record_first_data_index = index
+        return self._record_first_data_index
+
 
 class MFBlockStructure(object):
     """
@@ -264,7 +264,7 @@ class ModflowPcgn(Package):
         self.rate_c = rate_c
         self.ipunit = ipunit
         # error trapping
-        if self.ifill < 0 or self.ifill > 1:
+        if self.ifill not in (0, 1):
             raise TypeError('PCGN: ifill must be 0 or 1 - an ifill value of {0} was specified'.format(self.ifill))
         # add package
         self.parent.add_package(self)
@@ -278,67 +278,52 @@ class ModflowPcgn(Package):
         None
 
         """
-        # Open file for writing
-        f = open(self.fn_path, 'w')
-        f.write('{0:s}\n'.format(self.heading))
+        lines = ['{0:s}\n'.format(self.heading)]
 
         ifrfm = self.parent.get_ifrefm()
         if ifrfm:
             # dataset 1
-            line = '{} '.format(self.iter_mo)
-            line += '{} '.format(self.iter_mi)
-            line += '{} '.format(self.close_r)
-            line += '{}\n'.format(self.close_h)
-            f.write(line)
+            lines.append('{} {} {} {}\n'.format(self.iter_mo, self.iter_mi,
+                                                self.close_r, self.close_h))
 
             # dataset 2
-            line = '{} '.format(self.relax)
-            line += '{} '.format(self.ifill)
-            line += '{} '.format(self.unit_pc)
-            line += '{}\n'.format(self.unit_ts)
-            f.write(line)
+            lines.append('{} {} {} {}\n'.format(self.relax, self.ifill,
+                                                self.unit_pc, self.unit_ts))
 
             # dataset 3
-            line = '{} '.format(self.adamp)
-            line += '{} '.format(self.damp)
-            line += '{} '.format(self.damp_lb)
-            line += '{} '.format(self.rate_d)
-            line += '{}\n'.format(self.chglimit)
-            f.write(line)
+            lines.append('{} {} {} {} {}\n'.format(self.adamp, self.damp,
+                                                   self.damp_lb, self.rate_d,
+                                                   self.chglimit))
 
             # dataset 4
-            line = '{} '.format(self.acnvg)
-            line += '{} '.format(self.cnvg_lb)
-            line += '{} '.format(self.mcnvg)
-            line += '{} '.format(self.rate_c)
-            line += '{}\n'.format(self.ipunit)
-            f.write(line)
+            lines.append('{} {} {} {} {}\n'.format(self.acnvg, self.cnvg_lb,
+                                                   self.mcnvg, self.rate_c,
+                                                   self.ipunit))
 
         else:
             # dataset 1
             sfmt = ' {0:9d} {1:9d} {2:9.3g} {3:9.3g}\n'
-            line = sfmt.format(self.iter_mo, self.iter_mi, self.close_r,
-                               self.close_h)
-            f.write(line)
+            lines.append(sfmt.format(self.iter_mo, self.iter_mi, self.close_r,
+                                     self.close_h))
 
             # dataset 2
             sfmt = ' {0:9.3g} {1:9d} {2:9d} {3:9d}\n'
-            line = sfmt.format(self.relax, self.ifill, self.unit_pc,
-                               self.unit_ts)
-            f.write(line)
+            lines.append(sfmt.format(self.relax, self.ifill, self.unit_pc,
+                                     self.unit_ts))
 
             # dataset 3
             sfmt = ' {0:9d} {1:9.3g} {2:9.3g} {3:9.3g} {4:9.3g}\n'
-            line = sfmt.format(self.adamp, self.damp, self.damp_lb,
-                               self.rate_d, self.chglimit)
-            f.write(line)
+            lines.append(sfmt.format(self.adamp, self.damp, self.damp_lb,
+                                     self.rate_d, self.chglimit))
 
             # dataset 4
             sfmt = ' {0:9d} {1:9.3g} {2:9d} {3:9.3g} {4:9d}\n'
-            line = sfmt.format(self.acnvg, self.cnvg_lb, self.mcnvg,
-                               self.rate_c, self.ipunit)
-            f.write(line)
-        f.close()
+            lines.append(sfmt.format(self.acnvg, self.cnvg_lb, self.mcnvg,
+                                     self.rate_c, self.ipunit))
+
+        # write the complete file in a single call
+        with open(self.fn_path, 'w') as f:
+            f.write(''.join(lines))
 
     @staticmethod
     def load(f, model, ext_unit_dict=None):